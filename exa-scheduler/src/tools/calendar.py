@@ -1,8 +1,9 @@
 import json
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import ClassVar, List, Dict, Optional, Tuple
 from pydantic import Field
 from src.tools.base import BaseTool
+from src.tools.serialization import encode_page, parse_cursor
 
 DATA_DIR = Path("data")
 DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -10,14 +11,19 @@ CALENDAR_FILE = DATA_DIR / "calendar.json"
 
 class CalendarTool(BaseTool):
     name: str = "calendar"
-    description: str = "Manage calendar events. Actions: 'add', 'list'. Args: title, start, end (ISO8601 strings)."
+    description: str = "Manage calendar events. Actions: 'add', 'list'. Args: title, start, end (ISO8601 strings). 'list' returns a compact table; pass its next_cursor as cursor to fetch more."
     action: str = Field(..., description="Action to perform: 'add' or 'list'")
     title: Optional[str] = Field(None, description="Title of the event (required for 'add')")
     start: Optional[str] = Field(None, description="Start time ISO8601 (required for 'add')")
     end: Optional[str] = Field(None, description="End time ISO8601 (required for 'add')")
     date: Optional[str] = Field(None, description="Date to list events for YYYY-MM-DD (optional for 'list')")
+    limit: Optional[int] = Field(None, description="Maximum number of events to return (optional for 'list')")
+    cursor: Optional[str] = Field(None, description="next_cursor from a previous 'list' result (optional for 'list')")
 
-    def run(self, action: str, title: Optional[str] = None, start: Optional[str] = None, end: Optional[str] = None, date: Optional[str] = None) -> str:
+    list_fields: ClassVar[Tuple[str, ...]] = ("title", "start", "end")
+    max_output_chars: ClassVar[int] = 2000
+
+    def run(self, action: str, title: Optional[str] = None, start: Optional[str] = None, end: Optional[str] = None, date: Optional[str] = None, limit: Optional[int] = None, cursor: Optional[str] = None) -> str:
         events = self._load_events()
 
         if action == "add":
@@ -42,7 +48,14 @@ class CalendarTool(BaseTool):
             if not filtered:
                 return f"No events found for date {date}." if date else "No events found."
             
-            return json.dumps(filtered, indent=2)
+            offset = parse_cursor(cursor)
+            if offset is None:
+                return f"Error: invalid cursor '{cursor}'."
+            if offset >= len(filtered):
+                return "No more events."
+
+            output, _ = encode_page("events", filtered, self.list_fields, offset=offset, limit=limit, max_chars=self.max_output_chars)
+            return output
 
         return f"Unknown action: {action}"
 
@@ -1,8 +1,9 @@
 import json
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import ClassVar, List, Dict, Optional, Tuple
 from pydantic import Field
 from src.tools.base import BaseTool
+from src.tools.serialization import encode_page, parse_cursor
 
 DATA_DIR = Path("data")
 DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -10,12 +11,17 @@ REMINDERS_FILE = DATA_DIR / "reminders.json"
 
 class RemindersTool(BaseTool):
     name: str = "reminders"
-    description: str = "Manage reminders. Actions: 'add', 'list'. Args: task, due (ISO8601)."
+    description: str = "Manage reminders. Actions: 'add', 'list'. Args: task, due (ISO8601). 'list' returns a compact table; pass its next_cursor as cursor to fetch more."
     action: str = Field(..., description="Action to perform: 'add' or 'list'")
     task: Optional[str] = Field(None, description="Task description (required for 'add')")
     due: Optional[str] = Field(None, description="Due date/time ISO8601 (optional for 'add')")
+    limit: Optional[int] = Field(None, description="Maximum number of reminders to return (optional for 'list')")
+    cursor: Optional[str] = Field(None, description="next_cursor from a previous 'list' result (optional for 'list')")
 
-    def run(self, action: str, task: Optional[str] = None, due: Optional[str] = None) -> str:
+    list_fields: ClassVar[Tuple[str, ...]] = ("task", "due")
+    max_output_chars: ClassVar[int] = 1500
+
+    def run(self, action: str, task: Optional[str] = None, due: Optional[str] = None, limit: Optional[int] = None, cursor: Optional[str] = None) -> str:
         reminders = self._load_reminders()
 
         if action == "add":
@@ -32,7 +38,17 @@ class RemindersTool(BaseTool):
                 return "No reminders found."
             # Filter incomplete ones
             incomplete = [r for r in reminders if not r.get("completed")]
-            return json.dumps(incomplete, indent=2)
+            if not incomplete:
+                return "No reminders found."
+
+            offset = parse_cursor(cursor)
+            if offset is None:
+                return f"Error: invalid cursor '{cursor}'."
+            if offset >= len(incomplete):
+                return "No more reminders."
+
+            output, _ = encode_page("reminders", incomplete, self.list_fields, offset=offset, limit=limit, max_chars=self.max_output_chars)
+            return output
 
         return f"Unknown action: {action}"
 
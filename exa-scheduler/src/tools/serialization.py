@@ -0,0 +1,78 @@
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_MAX_CHARS = 2000
+
+def encode_value(value: Any) -> str:
+    """
+    Encodes a single cell. Plain strings are emitted bare; anything that could
+    be confused with the table syntax (commas, quotes, newlines, padding) or is
+    not a string is JSON-encoded.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        if value == "" or value != value.strip() or any(c in value for c in ',"\n\r'):
+            return json.dumps(value)
+        return value
+    return json.dumps(value, separators=(",", ":"))
+
+def encode_row(record: Dict[str, Any], fields: Sequence[str]) -> str:
+    """
+    Projects a record onto `fields` and encodes it as one comma-separated line.
+    """
+    return ",".join(encode_value(record.get(field)) for field in fields)
+
+def parse_cursor(cursor: Optional[str]) -> Optional[int]:
+    """
+    Converts a cursor returned by `encode_page` back into a record offset.
+    Returns None if the cursor is malformed.
+    """
+    if cursor is None or cursor == "":
+        return 0
+    try:
+        offset = int(cursor)
+    except (TypeError, ValueError):
+        return None
+    return offset if offset >= 0 else None
+
+def encode_page(
+    label: str,
+    records: List[Dict[str, Any]],
+    fields: Sequence[str],
+    offset: int = 0,
+    limit: Optional[int] = None,
+    max_chars: int = DEFAULT_MAX_CHARS,
+) -> Tuple[str, Optional[str]]:
+    """
+    Serializes a page of records as a compact, field-projected table:
+
+        events[57]{title,start,end}:
+        Standup,2024-05-01T09:00,2024-05-01T09:15
+        ...
+        next_cursor: 12 (45 more)
+
+    The header carries the total match count and the column names once, so each
+    row only pays for its values. Rows are added from `offset` until `limit`
+    rows are emitted or the output would exceed `max_chars` (at least one row is
+    always emitted). Returns the text and the cursor for the next page, or None
+    if this page reaches the end.
+    """
+    total = len(records)
+    lines = [f"{label}[{total}]{{{','.join(fields)}}}:"]
+    size = len(lines[0])
+    end = total if limit is None else min(total, offset + max(limit, 1))
+
+    index = offset
+    while index < end:
+        row = encode_row(records[index], fields)
+        if index > offset and size + 1 + len(row) > max_chars:
+            break
+        lines.append(row)
+        size += 1 + len(row)
+        index += 1
+
+    next_cursor = str(index) if index < total else None
+    if next_cursor is not None:
+        lines.append(f"next_cursor: {next_cursor} ({total - index} more)")
+    return "\n".join(lines), next_cursor
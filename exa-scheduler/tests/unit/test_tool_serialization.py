@@ -0,0 +1,97 @@
+import json
+
+import pytest
+
+from src.tools import calendar as calendar_module
+from src.tools import reminders as reminders_module
+from src.tools.calendar import CalendarTool
+from src.tools.reminders import RemindersTool
+from src.tools.serialization import encode_page, encode_value, parse_cursor
+
+
+def approx_tokens(text: str) -> int:
+    # ~4 characters per token is close enough for comparing encodings.
+    return len(text) // 4 + 1
+
+
+@pytest.fixture
+def large_calendar(tmp_path, monkeypatch):
+    events = [
+        {
+            "title": f"Sync with team {i % 17}",
+            "start": f"2024-05-{(i % 28) + 1:02d}T{9 + i % 8:02d}:00",
+            "end": f"2024-05-{(i % 28) + 1:02d}T{9 + i % 8:02d}:30",
+        }
+        for i in range(500)
+    ]
+    path = tmp_path / "calendar.json"
+    path.write_text(json.dumps(events))
+    monkeypatch.setattr(calendar_module, "CALENDAR_FILE", path)
+    return events
+
+
+def test_encode_value_quotes_ambiguous_strings():
+    assert encode_value("Lunch") == "Lunch"
+    assert encode_value("Lunch, with Ana") == '"Lunch, with Ana"'
+    assert encode_value("") == '""'
+    assert encode_value(None) == ""
+    assert encode_value(False) == "false"
+
+
+def test_encode_page_projects_fields():
+    records = [{"title": "A", "start": "s", "end": "e", "internal_id": 42}]
+    output, next_cursor = encode_page("events", records, ("title", "start", "end"))
+    assert output == "events[1]{title,start,end}:\nA,s,e"
+    assert next_cursor is None
+
+
+def test_parse_cursor_rejects_garbage():
+    assert parse_cursor(None) == 0
+    assert parse_cursor("12") == 12
+    assert parse_cursor("abc") is None
+    assert parse_cursor("-1") is None
+
+
+def test_calendar_list_respects_budget(large_calendar):
+    output = CalendarTool(action="list").run(action="list")
+    assert len(output) <= CalendarTool.max_output_chars + 64
+    assert "next_cursor:" in output
+
+
+def test_calendar_pagination_covers_all_events(large_calendar):
+    tool = CalendarTool(action="list")
+    seen, cursor = [], None
+    while True:
+        output = tool.run(action="list", limit=50, cursor=cursor)
+        lines = output.splitlines()
+        if lines[-1].startswith("next_cursor:"):
+            cursor = lines[-1].split()[1]
+            seen.extend(lines[1:-1])
+        else:
+            seen.extend(lines[1:])
+            break
+    assert len(seen) == len(large_calendar)
+    assert tool.run(action="list", cursor=str(len(large_calendar))) == "No more events."
+    assert tool.run(action="list", cursor="bogus").startswith("Error")
+
+
+def test_calendar_token_reduction_per_turn(large_calendar):
+    # Tool messages stay in history and are resent on every later turn, so the
+    # per-turn cost is the size of one 'list' result.
+    before = approx_tokens(json.dumps(large_calendar, indent=2))
+    after = approx_tokens(CalendarTool(action="list").run(action="list"))
+    full = approx_tokens(encode_page("events", large_calendar, CalendarTool.list_fields, max_chars=10**9)[0])
+    print(f"\ncalendar list tokens/turn: indented json={before} compact full={full} first page={after}")
+    assert full < before / 2
+    assert after < before / 20
+
+
+def test_reminders_list_hides_completed(tmp_path, monkeypatch):
+    path = tmp_path / "reminders.json"
+    path.write_text(json.dumps([
+        {"task": "Pay rent", "due": "2024-05-01", "completed": False},
+        {"task": "Old task", "due": None, "completed": True},
+    ]))
+    monkeypatch.setattr(reminders_module, "REMINDERS_FILE", path)
+    output = RemindersTool(action="list").run(action="list")
+    assert output == "reminders[1]{task,due}:\nPay rent,2024-05-01"